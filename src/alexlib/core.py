@@ -19,7 +19,7 @@ The module relies on standard Python libraries such as `dataclasses`, `datetime`
 """
 
 from datetime import datetime
-from functools import partial
+from functools import cache, partial
 from json import JSONDecodeError, dumps
 from json import loads as json_loads
 from logging import getLogger
@@ -35,12 +35,15 @@ from alexlib.constants import CLIPBOARD_COMMANDS_MAP
 
 logger = getLogger(__name__)
 
+NONE_STRINGS = frozenset(("none", ""))
+TRUE_STRINGS = frozenset(("true", "t", "1", "yes", "y", "on"))
+FALSE_STRINGS = frozenset(("false", "f", "0", "no", "n", "off"))
+
 
 def isnone(w: str) -> bool:
     """checks if input is None or empty string"""
     if isinstance(w, str):
-        processed_str = w.strip().lower()
-        ret = processed_str == "none" or len(processed_str) == 0
+        ret = w.strip().lower() in NONE_STRINGS
     else:
         ret = w is None
     return ret
@@ -56,12 +59,8 @@ def istrue(w: str | int) -> bool:
         ret = bool(w)
     elif isinstance(w, str):
         processed_str = w.strip().lower()
-        ret = processed_str in ("true", "t", "1", "yes", "y", "on")
-        ret = (
-            processed_str not in ("false", "f", "0", "no", "n", "off")
-            if not ret
-            else ret
-        )
+        ret = processed_str in TRUE_STRINGS
+        ret = processed_str not in FALSE_STRINGS if not ret else ret
         ret = bool(int(w)) if w.isnumeric() else ret
     else:
         raise TypeError(f"input is {type(w)}, which is not supported")
@@ -87,9 +86,9 @@ def chktext(
     return ret
 
 
-iswindows = partial(chktext, platform, prefix="win")
-ismacos = partial(chktext, platform, prefix="darwin")
-islinux = partial(chktext, platform, prefix="linux")
+iswindows = cache(partial(chktext, platform, prefix="win"))
+ismacos = cache(partial(chktext, platform, prefix="darwin"))
+islinux = cache(partial(chktext, platform, prefix="linux"))
 
 
 def path_istype(path: Path, suffix: str) -> bool:
@@ -155,7 +154,7 @@ def chkenv(
 
 def isdunder(key: str) -> bool:
     """checks if input is a dunder variable"""
-    return key.endswith("__") and key.startswith("__")
+    return key[:2] == "__" and key[-2:] == "__"
 
 
 def ishidden(key: str) -> bool:
@@ -22,12 +22,13 @@ Dependencies: collections, dataclasses, datetime, functools, json, logging, os,
 """
 
 from collections.abc import Hashable, Mapping
-from hashlib import sha256
+from hashlib import new as new_hash
 from json import dumps
 from json import loads as json_loads
 from logging import getLogger
 from os import environ
-from pathlib import Path
+from os.path import basename
+from pathlib import Path, PurePath
 from typing import Union
 
 from matplotlib.pyplot import savefig
@@ -159,22 +160,36 @@ def path_search(
     raise FileNotFoundError(f"no {pattern} found in {start_path}")
 
 
-def sha256sum(path: Path) -> str:
+def filehash(path: Path, algorithm: str = "sha256") -> str:
     """inputs:
         path: path to file
+        algorithm: hashlib algorithm name, e.g. sha256 or blake2b
     returns:
         hash of file
+    raises:
+        ValueError if the algorithm has a variable-length digest, e.g. shake_128
     """
     bytearr = bytearray(128 * 1024)
     if not isinstance(path, Path):
         raise TypeError("func only computes sum on path")
-    h, mv = sha256(), memoryview(bytearr)
+    h, mv = new_hash(algorithm), memoryview(bytearr)
+    if not h.digest_size:
+        raise ValueError(f"{algorithm} has a variable-length digest")
     with open(path, "rb", buffering=0) as f:
         for n in iter(lambda: f.readinto(mv), 0):
             h.update(mv[:n])
     return h.hexdigest()
 
 
+def sha256sum(path: Path) -> str:
+    """inputs:
+        path: path to file
+    returns:
+        sha256 hash of file
+    """
+    return filehash(path, algorithm="sha256")
+
+
 def chkhash(path: Path, stored_hash: str) -> bool:
     """checks if hash of file matches stored hash"""
     return sha256sum(path) == stored_hash
@@ -185,17 +200,26 @@ def normalize_path(path: Union[Path, str]) -> Path:
     return Path(path) if isinstance(path, str) else path
 
 
+def get_filename(path: Union[PurePath, str]) -> str:
+    """Get the final path component, only building a PurePath from a str if needed."""
+    if isinstance(path, PurePath):
+        return path.name
+    name = basename(path)
+    # trailing separators and "." components need PurePath's normalisation
+    return PurePath(path).name if name in ("", ".") else name
+
+
 def is_dotenv(path: Union[Path, str]) -> bool:
     """Check if the file is a dotenv file."""
-    path = normalize_path(path)
-    name = path.name.lower()
-    return name.startswith(".env") or path.suffix == ".env"
+    name = get_filename(path)
+    return name.lower().startswith(".env") or name.endswith(".env")
 
 
 def is_json(path: Union[Path, str]) -> bool:
     """Check if the file is a JSON file."""
-    path = normalize_path(path)
-    return path.suffix.lower() == ".json"
+    name = get_filename(path).lower()
+    # a bare ".json" is a stem with no suffix, as with Path(".json").suffix
+    return name.endswith(".json") and name != ".json"
 
 
 def dump_envs(
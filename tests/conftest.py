@@ -3,11 +3,13 @@ from datetime import datetime
 from os import environ
 from pathlib import Path
 from random import choice
-from tempfile import NamedTemporaryFile, TemporaryDirectory
+from secrets import token_hex
+from shutil import which
+from tempfile import TemporaryDirectory
 
 from faker import Faker
 from pandas import DataFrame
-from pytest import FixtureRequest, fixture
+from pytest import FixtureRequest, Item, fixture, mark
 
 from alexlib.constants import (
     CLIPBOARD_COMMANDS_MAP,
@@ -30,11 +32,10 @@ from alexlib.constants import (
     TIME_FORMAT,
     VENVS,
 )
-from alexlib.core import chkcmd, get_clipboard_cmd
+from alexlib.core import get_clipboard_cmd
 from alexlib.files import (
     CreatedTimestamp,
     Directory,
-    DotenvFile,
     File,
     JsonFile,
     ModifiedTimestamp,
@@ -70,6 +71,40 @@ CORE_STRINGS = (
     SQL_CHARS,
 ) + ENVIRONMENTS
 
+CLIPBOARD_PASTE_COMMANDS = {
+    "pbcopy": ["pbpaste"],
+    "xclip": ["xclip", "-selection", "clipboard", "-o"],
+    "xsel": ["xsel", "--clipboard", "--output"],
+}
+try:
+    CLIPBOARD_CMD = get_clipboard_cmd()
+except OSError:
+    CLIPBOARD_CMD = None
+CLIPBOARD_PASTE_CMD = (
+    CLIPBOARD_PASTE_COMMANDS.get(CLIPBOARD_CMD[0]) if CLIPBOARD_CMD else None
+)
+if CLIPBOARD_PASTE_CMD is not None and which(CLIPBOARD_PASTE_CMD[0]) is None:
+    CLIPBOARD_PASTE_CMD = None
+if CLIPBOARD_CMD is None:
+    NO_CLIPBOARD = mark.skip(reason="no supported clipboard tool on this platform")
+    CLIPBOARD_SKIPS = {"clipboard": NO_CLIPBOARD, "clipboard_paste": NO_CLIPBOARD}
+else:
+    CLIPBOARD_SKIPS = {
+        "no_clipboard": mark.skip(reason="a clipboard tool is available")
+    }
+    if CLIPBOARD_PASTE_CMD is None:
+        CLIPBOARD_SKIPS["clipboard_paste"] = mark.skip(
+            reason=f"no paste command available for {CLIPBOARD_CMD[0]}"
+        )
+
+
+def pytest_collection_modifyitems(items: list[Item]) -> None:
+    """Skip clipboard-marked tests that cannot run here, at collection time."""
+    for item in items:
+        for name, skip in CLIPBOARD_SKIPS.items():
+            if item.get_closest_marker(name):
+                item.add_marker(skip)
+
 
 @fixture(scope="session", params=ENVIRONMENTS)
 def environment(request: FixtureRequest) -> str:
@@ -122,13 +157,12 @@ def faker():
 
 
 @fixture(scope="session")
-def environ_keys():
-    return list(environ.keys())
-
-
-@fixture(scope="function")
-def rand_env(environ_keys: list[str]) -> str:
-    return choice(environ_keys)
+def rand_env(worker_id: str) -> Generator[str, None, None]:
+    """Set a worker-unique environment variable and return its name."""
+    name = f"RAND_{worker_id}_{token_hex(4)}".upper()
+    environ[name] = token_hex(8)
+    yield name
+    environ.pop(name, None)
 
 
 @fixture(scope="session")
@@ -227,24 +261,6 @@ def toml_file(toml_path: Path):
     return TomlFile.from_path(toml_path)
 
 
-@fixture(scope="module")
-def dotenv_path(dir_path: Path):
-    path = dir_path / ".env"
-    path.touch()
-    path.write_text(
-        """
-        EXAMPLE_VAR=some_value
-        ANOTHER_VAR=another_value
-        """
-    )
-    return path
-
-
-@fixture(scope="module")
-def dotenv_file(dotenv_path: Path):
-    return DotenvFile.from_path(dotenv_path)
-
-
 @fixture(scope="module")
 def settings_path(temp_dir: Path):
     return temp_dir / "settings.json"
@@ -278,11 +294,9 @@ def rand_val(settings_file: SettingsFile, rand_key: str):
 
 
 @fixture(scope="function")
-def file_path(temp_dir: Path, faker: Faker):
-    test_file = temp_dir / NamedTemporaryFile("w", delete=False).name
-    test_file.write_text(faker.text())
-    yield test_file
-    test_file.unlink()
+def file_path(tmp_path: Path, faker: Faker) -> Path:
+    (test_file := tmp_path / f"{faker.word()}.txt").write_text(faker.text())
+    return test_file
 
 
 @fixture(scope="function")
@@ -290,6 +304,12 @@ def file_obj(file_path: Path) -> File:
     return File.from_path(file_path)
 
 
+@fixture(scope="session")
+def clipboard_paste_cmd() -> list[str] | None:
+    """Return the paste command that matches the resolved clipboard tool."""
+    return CLIPBOARD_PASTE_CMD
+
+
 @fixture(scope="function")
 def copy_text():
     return "Text copied to clipboard successfully."
@@ -301,19 +321,6 @@ def copy_path(file_path: Path, copy_text: str):
     return file_path
 
 
-@fixture(scope="function")
-def cmd():
-    try:
-        get_clipboard_cmd()
-    except OSError:
-        return None
-
-
-@fixture(scope="function")
-def hascmd(cmd):
-    return chkcmd(cmd[0]) if cmd is not None else False
-
-
 @fixture(scope="function")
 def csv_path(dir_path: Path):
     return dir_path / "test_df.csv"
@@ -5,6 +5,8 @@ from pytest import fixture, mark, raises
 from alexlib import Version
 from alexlib.constants import MODULE_PATH
 
+pytestmark = mark.slow
+
 
 @fixture(scope="session")
 def module_path_string() -> str:
@@ -16,7 +18,6 @@ def version_from_sys() -> Version:
     return Version.from_sys()
 
 
-@mark.slow
 def test_version_from_sys(version_from_sys: Version):
     assert version_from_sys.major == version_info.major
     assert version_from_sys.minor == version_info.minor
@@ -24,7 +25,6 @@ def test_version_from_sys(version_from_sys: Version):
     assert version_from_sys.project_name == "Python"
 
 
-@mark.slow
 def test_version_from_pyproject():
     if version_info.minor <= 10:
         with raises(ImportError):
@@ -43,7 +43,6 @@ def test_version_from_pyproject():
         assert version_from_pyproject.project_name == "alexlib"
 
 
-@mark.slow
 def test_version_eq(version_from_sys: Version):
     if version_info.minor <= 10:
         with raises(ImportError):
@@ -58,7 +57,6 @@ def version_from_str() -> Version:
     return Version.from_str("1.2.3", project_name="alexlib")
 
 
-@mark.slow
 def test_version_from_str_init(version_from_str: Version):
     assert version_from_str.major == 1
     assert version_from_str.minor == 2
@@ -66,11 +64,9 @@ def test_version_from_str_init(version_from_str: Version):
     assert version_from_str == Version(1, 2, 3)
 
 
-@mark.slow
 def test_version_from_str_repr(version_from_str: Version):
     assert repr(version_from_str) == "alexlib v1.2.3"
 
 
-@mark.slow
 def test_module_path_on_syspath(module_path_string: str):
     assert module_path_string in path
@@ -4,10 +4,10 @@ from datetime import datetime
 from os import environ
 from pathlib import Path
 from socket import socket
-from subprocess import Popen
+from subprocess import check_output
 from typing import Any
 
-from pytest import FixtureRequest, fixture, mark, raises
+from pytest import CaptureFixture, FixtureRequest, MonkeyPatch, fixture, mark, raises
 
 from alexlib.core import (
     asdict,
@@ -34,7 +34,11 @@ from alexlib.core import (
     show_environ,
     to_clipboard,
 )
-from alexlib.files.utils import dump_envs, is_dotenv, is_json, sha256sum
+from alexlib.files.utils import (
+    is_dotenv,
+    is_json,
+    sha256sum,
+)
 
 
 def test_core_path(core_path: Path):
@@ -79,167 +83,85 @@ def test_aslist(string: str, sep: str, expected: list[str]) -> None:
     assert lst == expected
 
 
-@fixture(scope="module")
-def _testclass():
-    class TestClass:
-        def __init__(self):
-            self.a = 1
-            self.b = 2
-            self._c = 3
-            self.__d__ = 4
+class _TestClass:
+    """Test class for `asdict` and `get_attrs` functions."""
+
+    def __init__(
+        self,
+        public_attr: str = "public",
+        hidden_attr: str = "hidden",
+        dunder_attr: str = "dunder",
+    ) -> None:
+        self.public_attr = public_attr
+        self._hidden_attr = hidden_attr
+        self.__dunder_attr__ = dunder_attr
+
+    def public_method(self):
+        return self.public_attr
+
+    def _hidden_method(self):
+        return self._hidden_attr
+
+    def __dunder_method__(self):
+        return self.__dunder_attr__
+
+
+@fixture(scope="session")
+def test_obj():
+    return _TestClass()
+
 
-    return TestClass()
+ASDICT_VALUES = {
+    "public_attr": "public",
+    "_hidden_attr": "hidden",
+    "__dunder_attr__": "dunder",
+}
 
 
 @mark.parametrize(
-    "key, value, include_hidden, include_dunder, isin",
+    "include_hidden, include_dunder",
     (
-        (
-            "a",
-            1,
-            False,
-            False,
-            True,
-        ),
-        (
-            "b",
-            2,
-            False,
-            False,
-            True,
-        ),
-        (
-            "_c",
-            3,
-            False,
-            False,
-            False,
-        ),
-        (
-            "__d__",
-            4,
-            False,
-            False,
-            False,
-        ),
-        (
-            "a",
-            1,
-            True,
-            False,
-            True,
-        ),
-        (
-            "b",
-            2,
-            True,
-            False,
-            True,
-        ),
-        (
-            "_c",
-            3,
-            True,
-            False,
-            True,
-        ),
-        (
-            "__d__",
-            4,
-            True,
-            False,
-            False,
-        ),
-        (
-            "a",
-            1,
-            False,
-            True,
-            True,
-        ),
-        (
-            "b",
-            2,
-            False,
-            True,
-            True,
-        ),
-        (
-            "_c",
-            3,
-            False,
-            True,
-            False,
-        ),
-        (
-            "__d__",
-            4,
-            False,
-            True,
-            True,
-        ),
-        (
-            "a",
-            1,
-            True,
-            True,
-            True,
-        ),
-        (
-            "b",
-            2,
-            True,
-            True,
-            True,
-        ),
-        (
-            "_c",
-            3,
-            True,
-            True,
-            True,
-        ),
-        (
-            "__d__",
-            4,
-            True,
-            True,
-            True,
-        ),
+        (False, False),
+        (True, False),
+        (False, True),
+        (True, True),
     ),
 )
-def test_asdict(_testclass, key, value, include_hidden, include_dunder, isin):
-    dct = asdict(
-        _testclass, include_hidden=include_hidden, include_dunder=include_dunder
-    )
+def test_asdict(test_obj, include_hidden: bool, include_dunder: bool) -> None:
+    dct = asdict(test_obj, include_hidden=include_hidden, include_dunder=include_dunder)
     assert isinstance(dct, dict)
-    assert (key in dct) == isin
-    if isin:
-        assert dct[key] == value
+    expected = {
+        "public_attr": True,
+        "_hidden_attr": include_hidden,
+        "__dunder_attr__": include_dunder,
+    }
+    for key, isin in expected.items():
+        assert (key in dct) is isin, key
+        if isin:
+            assert dct[key] == ASDICT_VALUES[key]
 
 
-def test_sha256sum_on_path(file_path: Path):
-    """Test the `sha256sum` function on a path."""
-    assert isinstance(sha256sum(file_path), str)
+@fixture(scope="session")
+def hash_path(temp_dir: Path) -> Path:
+    path = temp_dir / "sha256sum.txt"
+    path.write_text("Line 1\nLine 2")
+    return path
 
 
-@mark.slow
-def test_dump_envs_unsupported_type(dir_path: Path):
-    """Test unsupported file types"""
-    test_path = dir_path / "output.unsupported"
-    pairs = {"KEY": "VALUE"}
-    with raises(ValueError):
-        dump_envs(test_path, pairs)
+@fixture(scope="session")
+def file_sha256(hash_path: Path) -> str:
+    return sha256sum(hash_path)
+
+
+def test_sha256sum_on_path(file_sha256: str):
+    """Test the `sha256sum` function on a path."""
+    assert isinstance(file_sha256, str)
 
 
 def test_with_list_values_including_duplicates() -> None:
     """Test with list values including duplicates."""
     test_dict = {"a": [1, 2, 2, 3], "b": ["x", "y", "y"]}
-    expected = {"a": [1, 2, 3], "b": ["x", "y"]}
-    result = mk_dictvals_distinct(test_dict)
-    assert all(
-        (sorted(result[key]) == sorted(expected[key]) for key in test_dict.keys())
-    )
+    assert mk_dictvals_distinct(test_dict) == {"a": {1, 2, 3}, "b": {"x", "y"}}
 
 
 def test_with_dict() -> None:
@@ -247,13 +169,12 @@ def test_with_dict() -> None:
     test_dict = {"a": 1, "b": 2}
     expected = {1: "a", 2: "b"}
     result = invert_dict(test_dict)
-    assert sorted(result.keys()) == sorted(expected.keys())
-    assert sorted(result.values()) == sorted(expected.values())
+    assert result == expected
 
 
 @mark.parametrize(
     "value",
-    (1, 0.0, None, False),
+    (1, 0.0, None, False, 1.123),
 )
 def test_to_clipboard_typeerror(value):
     with raises(TypeError):
@@ -275,47 +196,29 @@ def test_chkcmd():
 
 
 @mark.slow
-def test_copy_existing_file(copy_path, copy_text):
-    if iswindows() or ismacos():
-        assert copy_file_to_clipboard(copy_path)
-    else:
-        assert islinux()
-        has = chkcmd("xclip") or chkcmd("xsel")
-        if has:
-            assert copy_file_to_clipboard(copy_path)
-        else:
-            with raises(OSError):
-                copy_file_to_clipboard(copy_path)
+@mark.clipboard
+def test_copy_existing_file(copy_path):
+    assert copy_file_to_clipboard(copy_path)
 
 
 @mark.slow
-def test_to_clipboard_success(copy_text):
-    if not islinux():
-        assert (
-            to_clipboard(copy_text)
-            == Popen(["pbpaste"], stdout=-1).communicate()[0].decode()
-        )
-    else:
-        has = chkcmd("xclip") or chkcmd("xsel")
-        if has:
-            assert (
-                to_clipboard(copy_text)
-                == Popen(["xclip", "-selection", "clipboard", "-o"], stdout=-1)
-                .communicate()[0]
-                .decode()
-            )
-        else:
-            with raises(OSError):
-                to_clipboard(copy_text)
-
-
-def test_copy_path_not_a_file():
-    try:
-        with raises(FileNotFoundError):
-            copy_file_to_clipboard(Path("/fake/path"))
-    except OSError as e:
-        with raises(OSError):
-            assert copy_file_to_clipboard(Path("/fake/path")), e
+@mark.no_clipboard
+def test_copy_existing_file_without_tool(copy_path):
+    with raises(OSError):
+        copy_file_to_clipboard(copy_path)
+
+
+@mark.slow
+@mark.clipboard_paste
+def test_to_clipboard_success(copy_text: str, clipboard_paste_cmd: list[str]):
+    assert to_clipboard(copy_text) == check_output(clipboard_paste_cmd, text=True)
+
+
+@mark.slow
+@mark.no_clipboard
+def test_to_clipboard_without_tool(copy_text):
+    with raises(OSError):
+        to_clipboard(copy_text)
 
 
 ATTRS = (
@@ -330,121 +233,55 @@ METHODS = (
 )
 
 
-@fixture(scope="module", params=ATTRS)
-def attr(request: FixtureRequest) -> str:
-    return request.param
-
-
-@fixture(scope="module", params=METHODS)
-def method(request: FixtureRequest) -> str:
-    return request.param
-
-
-@fixture(scope="module", params=ATTRS + METHODS)
-def attr_or_method(request: FixtureRequest) -> str:
-    return request.param
-
-
-class _TestClass:
-    """Test class for `get_attrs` function."""
-
-    def __init__(
-        self,
-        public_attr: str = "public",
-        hidden_attr: str = "hidden",
-        dunder_attr: str = "dunder",
-    ) -> None:
-        self.public_attr = public_attr
-        self._hidden_attr = hidden_attr
-        self.__dunder_attr__ = dunder_attr
-
-    def public_method(self):
-        return self.public_attr
-
-    def _hidden_method(self):
-        return self._hidden_attr
-
-    def __dunder_method__(self):
-        return self.__dunder_attr__
-
-
-@fixture(scope="module")
-def test_obj():
-    return _TestClass()
-
-
-@fixture(scope="module")
-def all_attrs(test_obj):
-    return get_attrs(
-        test_obj,
-        hidden=True,
-        dunder=True,
-        methods=True,
-    )
-
-
-@fixture(scope="module")
-def public_attrs(test_obj):
-    return get_attrs(test_obj)
-
-
-@fixture(scope="module")
-def public_methods(test_obj):
-    return get_attrs(test_obj, methods=True)
-
-
-@fixture(scope="module")
-def hidden_attrs(test_obj):
-    return get_attrs(test_obj, hidden=True)
-
-
-@fixture(scope="module")
-def hidden_methods(test_obj):
-    return get_attrs(test_obj, methods=True, hidden=True)
-
-
-@fixture(scope="module")
-def dunder_attrs(test_obj):
-    return get_attrs(test_obj, dunder=True)
-
-
-@fixture(scope="module")
-def dunder_methods(test_obj):
-    return get_attrs(test_obj, methods=True, dunder=True)
+@fixture(scope="session")
+def attrs_bundle(test_obj: _TestClass) -> dict[str, dict[str, Any]]:
+    return {
+        "all": get_attrs(test_obj, hidden=True, dunder=True, methods=True),
+        "public_attrs": get_attrs(test_obj),
+        "public_methods": get_attrs(test_obj, methods=True),
+        "hidden_attrs": get_attrs(test_obj, hidden=True),
+        "hidden_methods": get_attrs(test_obj, methods=True, hidden=True),
+        "dunder_attrs": get_attrs(test_obj, dunder=True),
+        "dunder_methods": get_attrs(test_obj, methods=True, dunder=True),
+    }
 
 
-def test_get_all_attrs(all_attrs, attr_or_method):
-    assert attr_or_method in all_attrs
+def test_get_all_attrs(attrs_bundle):
+    assert set(ATTRS + METHODS) <= attrs_bundle["all"].keys()
 
 
-def test_get_public_attrs(public_attrs):
-    assert public_attrs == {"public_attr": "public"}
+def test_get_public_attrs(attrs_bundle):
+    assert attrs_bundle["public_attrs"] == {"public_attr": "public"}
 
 
-def test_get_public_methods(public_methods):
+def test_get_public_methods(attrs_bundle):
+    public_methods = attrs_bundle["public_methods"]
     assert "public_method" in public_methods
     assert "_hidden_method" not in public_methods
 
 
-def test_get_hidden_attrs(hidden_attrs):
-    assert hidden_attrs == {
+def test_get_hidden_attrs(attrs_bundle):
+    assert attrs_bundle["hidden_attrs"] == {
         "public_attr": "public",
         "_hidden_attr": "hidden",
     }
 
 
-def test_get_hidden_methods(hidden_methods):
+def test_get_hidden_methods(attrs_bundle):
+    hidden_methods = attrs_bundle["hidden_methods"]
     assert "_hidden_method" in hidden_methods
     assert "public_method" in hidden_methods
     assert "__dunder_method__" not in hidden_methods
 
 
-def test_get_dunder_attrs(dunder_attrs):
+def test_get_dunder_attrs(attrs_bundle):
+    dunder_attrs = attrs_bundle["dunder_attrs"]
     assert "__dunder_attr__" in dunder_attrs
     assert "public_attr" in dunder_attrs
 
 
-def test_get_dunder_methods(dunder_methods):
+def test_get_dunder_methods(attrs_bundle):
+    dunder_methods = attrs_bundle["dunder_methods"]
     assert "__dunder_method__" in dunder_methods
     assert "public_method" in dunder_methods
 
@@ -462,12 +299,17 @@ def test_with_specific_attribute() -> None:
     assert result[0].name == "test1"
 
 
-@mark.parametrize(
-    "string, type_, expected",
-    [
+ENVCAST_TRUES = {
+    "int": (
         ("1", "int", 1),
         ("1", int, 1),
+        ("0", int, 0),
+    ),
+    "float": (
         ("1.0", float, 1.0),
+        ("0.0", float, 0.0),
+    ),
+    "bool": (
         ("True", bool, True),
         ("true", bool, True),
         ("t", bool, True),
@@ -475,8 +317,6 @@ def test_with_specific_attribute() -> None:
         ("yes", bool, True),
         ("y", bool, True),
         ("on", bool, True),
-        ("0", int, 0),
-        ("0.0", float, 0.0),
         ("False", bool, False),
         ("false", bool, False),
         ("f", bool, False),
@@ -484,18 +324,26 @@ def test_with_specific_attribute() -> None:
         ("no", bool, False),
         ("n", bool, False),
         ("off", bool, False),
+    ),
+    "list": (
         ("[]", "list", []),
         ("[]", list, []),
         ("[1,2,3]", list, [1, 2, 3]),
         ("['a','b','c']", list, ["a", "b", "c"]),
+    ),
+    "dict": (
         ('{"a":1,"b":2}', dict, {"a": 1, "b": 2}),
         ('{"a":1,"b":2,"c":3}', dict, {"a": 1, "b": 2, "c": 3}),
         ('{"a":1,"b":2,"c":3,"d":4}', dict, {"a": 1, "b": 2, "c": 3, "d": 4}),
-    ],
-)
-def test_envcast_trues(string: str, type_: type, expected: bool) -> None:
+    ),
+}
+
+
+@mark.parametrize("cases", ENVCAST_TRUES.values(), ids=tuple(ENVCAST_TRUES))
+def test_envcast_trues(cases: tuple[tuple[str, type | str, Any], ...]) -> None:
     """Test envcast function for trues."""
-    assert envcast(string, type_) == expected
+    for string, type_, expected in cases:
+        assert envcast(string, type_) == expected, (string, type_)
 
 
 @mark.parametrize(
@@ -511,26 +359,28 @@ def test_envcast_falses(value: str, type_: type, error: type) -> None:
         envcast(value, type_, need=True)
 
 
+NON_EXISTING_PATH = Path("non_existing_file.txt")
+
+
 def test_chktype_path_not_exist() -> None:
     """Test chktype function with Path object."""
-    test_path = Path("non_existing_file.txt")  # Assume this file does not exist
     with raises(FileNotFoundError):
-        chktype(test_path, Path)
+        chktype(NON_EXISTING_PATH, Path)
 
 
-@mark.parametrize(
-    "path, suffix",
-    (
-        (Path("test.txt"), ".json"),
-        (Path("test.json"), ".txt"),
-        (Path(".env"), ".json"),
-        (Path("test.json"), ".env"),
-    ),
+CHKTYPE_SUFFIX_RAISES = (
+    (Path("test.txt"), ".json"),
+    (Path("test.json"), ".txt"),
+    (Path(".env"), ".json"),
+    (Path("test.json"), ".env"),
 )
-def test_chktype_path_suffix_raises(path: Path, suffix: str) -> None:
+
+
+def test_chktype_path_suffix_raises() -> None:
     """Test chktype function with Path object."""
-    with raises(ValueError):
-        chktype(path, Path, suffix=suffix, mustexist=False)
+    for path, suffix in CHKTYPE_SUFFIX_RAISES:
+        with raises(ValueError):
+            chktype(path, Path, suffix=suffix, mustexist=False)
 
 
 def test_isplatform() -> None:
@@ -538,27 +388,27 @@ def test_isplatform() -> None:
     assert any((iswindows(), islinux(), ismacos()))
 
 
-@mark.slow
-@mark.parametrize(
-    "text, kwargs, expected",
-    (
-        ("example text", {"prefix": "Exa"}, True),
-        ("example text", {"prefix": "test"}, False),
-        ("example text", {"value": "ample"}, True),
-        ("example text", {"value": "none"}, False),
-        ("example text", {"suffix": "text"}, True),
-        ("example text", {"suffix": "exam"}, False),
-        ("abc", {"prefix": "a"}, True),
-        ("abc", {"prefix": "b"}, False),
-        ("abc", {"suffix": "c"}, True),
-        ("abc", {"suffix": "b"}, False),
-        ("abc", {"value": "b"}, True),
-        ("abc", {"value": "a"}, True),
-    ),
+CHKTEXT_CASES = (
+    ("example text", {"prefix": "Exa"}, True),
+    ("example text", {"prefix": "test"}, False),
+    ("example text", {"value": "ample"}, True),
+    ("example text", {"value": "none"}, False),
+    ("example text", {"suffix": "text"}, True),
+    ("example text", {"suffix": "exam"}, False),
+    ("abc", {"prefix": "a"}, True),
+    ("abc", {"prefix": "b"}, False),
+    ("abc", {"suffix": "c"}, True),
+    ("abc", {"suffix": "b"}, False),
+    ("abc", {"value": "b"}, True),
+    ("abc", {"value": "a"}, True),
 )
-def test_chktext(text: str, kwargs: dict, expected: bool) -> None:
+
+
+@mark.fast
+def test_chktext() -> None:
     """Test chktext function."""
-    assert chktext(text, **kwargs) == expected
+    for text, kwargs, expected in CHKTEXT_CASES:
+        assert chktext(text, **kwargs) is expected, (text, kwargs)
 
 
 def test_chktext_raises() -> None:
@@ -578,20 +428,20 @@ def test_chktype_incorrect() -> None:
         chktype("value", int)
 
 
-@mark.parametrize(
-    "value, type_",
-    (
-        (123, int),
-        ("abc", str),
-        (Path(__file__), Path),
-        ([1, 2, 3], list),
-        ({"a": 1, "b": 2}, dict),
-        (True, bool),
-    ),
+CHKTYPE_CORRECT = (
+    (123, int),
+    ("abc", str),
+    (Path(__file__), Path),
+    ([1, 2, 3], list),
+    ({"a": 1, "b": 2}, dict),
+    (True, bool),
 )
-def test_chktype_correct(value: int, type_: type) -> None:
+
+
+def test_chktype_correct() -> None:
     """Test chktype function with correct input."""
-    assert chktype(value, type_) == value
+    for value, type_ in CHKTYPE_CORRECT:
+        assert chktype(value, type_) == value, value
 
 
 def test_chkenv_default_for_non_existing_variable() -> None:
@@ -623,9 +473,9 @@ def test_chkenv_existing_variable(rand_env: str) -> None:
         ("TEST_VAR", 123, int),
     ),
 )
-def test_chkenv_bool(env: str, value: bool, astype: type) -> None:
+def test_chkenv_bool(monkeypatch, env: str, value: bool, astype: type) -> None:
     """Test chkenv function with boolean values."""
-    environ[env] = str(value)
+    monkeypatch.setenv(env, str(value))
     assert chkenv(env, astype=astype) == value
 
 
@@ -634,32 +484,19 @@ ISJSON_TRUE_STRINGS = (
     "settings.json",
     "config.json",
     "package.json",
-)
-ISJSON_TRUE_PATHS = (
-    Path("test.json"),
-    Path("settings.json"),
-    Path("config.json"),
-    Path("package.json"),
+    "data/test.json/",
 )
 ISJSON_FALSE_STRINGS = (
     "test.txt",
     "test",
-)
-ISJSON_FALSE_PATHS = (
-    Path("test.txt"),
-    Path("test"),
+    ".json",
 )
 ISDOTENV_TRUE_STRINGS = (
     ".env",
     ".env.example",
     ".env.local",
     ".env.test",
-)
-ISDOTENV_TRUE_PATHS = (
-    Path(".env"),
-    Path(".env.example"),
-    Path(".env.local"),
-    Path(".env.test"),
+    "config/.env/",
 )
 ISDOTENV_FALSE_STRINGS = (
     "env.development",
@@ -669,14 +506,10 @@ ISDOTENV_FALSE_STRINGS = (
     "test.json",
     "test.txt",
 )
-ISDOTENV_FALSE_PATHS = (
-    Path("env.development"),
-    Path("settings.json"),
-    Path("config.json"),
-    Path("package.json"),
-    Path("test.json"),
-    Path("test.txt"),
-)
+ISJSON_TRUE_PATHS = tuple(map(Path, ISJSON_TRUE_STRINGS))
+ISJSON_FALSE_PATHS = tuple(map(Path, ISJSON_FALSE_STRINGS))
+ISDOTENV_TRUE_PATHS = tuple(map(Path, ISDOTENV_TRUE_STRINGS))
+ISDOTENV_FALSE_PATHS = tuple(map(Path, ISDOTENV_FALSE_STRINGS))
 ISJSON_TRUE = ISJSON_TRUE_STRINGS + ISJSON_TRUE_PATHS
 ISJSON_FALSE = ISJSON_FALSE_STRINGS + ISJSON_FALSE_PATHS
 ISDOTENV_TRUE = ISDOTENV_TRUE_STRINGS + ISDOTENV_TRUE_PATHS
@@ -748,30 +581,21 @@ ISHIDDEN_FALSE = (
 
 
 @mark.fast
-@mark.parametrize("is_dotenv_true", ISDOTENV_TRUE)
-def test_is_dotenv_true(is_dotenv_true: bool) -> None:
-    """Test to check .env detection"""
-    assert is_dotenv(is_dotenv_true) is True
-
-
-@mark.fast
-@mark.parametrize("is_dotenv_false", ISDOTENV_FALSE)
-def test_is_dotenv_false(is_dotenv_false: bool) -> None:
-    """Test to check non-.env files"""
-    assert is_dotenv(is_dotenv_false) is False
-
-
-@mark.fast
-@mark.parametrize("is_json_true", ISJSON_TRUE)
-def test_is_json_true(is_json_true: bool) -> None:
-    """Test to check JSON file detection"""
-    assert is_json(is_json_true) is True
+def test_is_dotenv() -> None:
+    """Test .env file detection."""
+    for value in ISDOTENV_TRUE:
+        assert is_dotenv(value) is True, value
+    for value in ISDOTENV_FALSE:
+        assert is_dotenv(value) is False, value
 
 
 @mark.fast
-@mark.parametrize("is_json_false", ISJSON_FALSE)
-def test_is_json_false(is_json_false: bool) -> None:
-    assert is_json(is_json_false) is False
+def test_is_json() -> None:
+    """Test JSON file detection."""
+    for value in ISJSON_TRUE:
+        assert is_json(value) is True, value
+    for value in ISJSON_FALSE:
+        assert is_json(value) is False, value
 
 
 @mark.fast
@@ -787,17 +611,12 @@ def test_is_a_path(a_path: Path) -> None:
 
 
 @mark.fast
-@mark.parametrize("value", ISTRUE_TRUE)
-def test_istrue_true(value: Any) -> None:
+def test_istrue() -> None:
     """Test istrue function."""
-    assert istrue(value) is True
-
-
-@mark.fast
-@mark.parametrize("value", ISTRUE_FALSE)
-def test_istrue_false(value: Any) -> None:
-    """Test istrue function."""
-    assert istrue(value) is False
+    for value in ISTRUE_TRUE:
+        assert istrue(value) is True, value
+    for value in ISTRUE_FALSE:
+        assert istrue(value) is False, value
 
 
 def test_istrue_raises_typeerror(now: datetime) -> None:
@@ -807,68 +626,55 @@ def test_istrue_raises_typeerror(now: datetime) -> None:
 
 
 @mark.fast
-@mark.parametrize("value", ISNONE_TRUE)
-def test_isnone_true(value: Any) -> None:
-    """Test isnone function."""
-    assert isnone(value) is True
-
-
-@mark.fast
-@mark.parametrize("value", ISNONE_FALSE)
-def test_isnone_false(value: Any) -> None:
+def test_isnone() -> None:
     """Test isnone function."""
-    assert isnone(value) is False
+    for value in ISNONE_TRUE:
+        assert isnone(value) is True, value
+    for value in ISNONE_FALSE:
+        assert isnone(value) is False, value
 
 
 @mark.fast
-@mark.parametrize("value", ISDUNDER_TRUE)
-def test_isdunder_true(value: Any) -> None:
+def test_isdunder() -> None:
     """Test isdunder function."""
-    assert isdunder(value) is True
+    for value in ISDUNDER_TRUE:
+        assert isdunder(value) is True, value
+    for value in ISDUNDER_FALSE:
+        assert isdunder(value) is False, value
 
 
 @mark.fast
-@mark.parametrize("value", ISDUNDER_FALSE)
-def test_isdunder_false(value: Any) -> None:
-    """Test isdunder function."""
-    assert isdunder(value) is False
+def test_ishidden() -> None:
+    """Test ishidden function."""
+    for value in ISHIDDEN_TRUE:
+        assert ishidden(value) is True, value
+    for value in ISHIDDEN_FALSE:
+        assert ishidden(value) is False, value
 
 
-@mark.fast
-@mark.parametrize("value", ISHIDDEN_TRUE)
-def test_ishidden_true(value: Any) -> None:
-    """Test ishidden function."""
-    assert ishidden(value) is True
+@fixture(scope="function")
+def mock_port(monkeypatch, request: FixtureRequest) -> int:
+    """Patch `socket.connect_ex` to return `request.param`."""
+    monkeypatch.setattr(socket, "connect_ex", lambda self, address: request.param)
+    return request.param
 
 
 @mark.parametrize(
-    "connect_ex_return_value, astext, expected_result, expected_log",
-    [
-        (0, False, True, "127.0.0.1:8080 is open"),
-        (1, False, False, "127.0.0.1:8080 is not open"),
-        (0, True, "127.0.0.1:8080 is open", "127.0.0.1:8080 is open"),
-        (1, True, "127.0.0.1:8080 is not open", "127.0.0.1:8080 is not open"),
-    ],
+    "mock_port, astext, expected",
+    (
+        (0, False, True),
+        (1, False, False),
+        (0, True, "127.0.0.1:8080 is open"),
+        (1, True, "127.0.0.1:8080 is not open"),
+    ),
+    indirect=["mock_port"],
 )
-def test_ping(
-    monkeypatch, caplog, connect_ex_return_value, astext, expected_result, expected_log
-):
-    """Test the ping function with different scenarios using parametrization."""
-
-    def mock_connect_ex(self, address):
-        return connect_ex_return_value  # Simulate port being open or closed
-
-    # Monkeypatch the socket's connect_ex method
-    monkeypatch.setattr(socket, "connect_ex", mock_connect_ex)
-
+def test_ping(caplog, mock_port: int, astext: bool, expected: bool | str) -> None:
+    """Test the ping function with the port open and closed."""
     with caplog.at_level("DEBUG"):
-        result = ping("127.0.0.1", 8080, astext=astext)
-
-    # Assert the function returns the expected result
-    assert result == expected_result
-
-    # Assert that the correct log message was generated
-    assert expected_log in caplog.text
+        assert ping("127.0.0.1", 8080, astext=astext) == expected
+    state = "open" if mock_port == 0 else "not open"
+    assert f"127.0.0.1:8080 is {state}" in caplog.text
 
 
 @mark.parametrize(
@@ -886,6 +692,9 @@ def test_clean_version_tag(tag: str, expected: str) -> None:
     assert clean_version_tag(tag) == expected
 
 
-def test_show_environ():
+def test_show_environ(monkeypatch: MonkeyPatch, capsys: CaptureFixture):
     """Test the `show_environ` function."""
+    monkeypatch.setattr("alexlib.core.environ", {"A": "1", "B": "2"})
     assert show_environ() is None
+    out = capsys.readouterr().out
+    assert '"A": "1"' in out and '"B": "2"' in out
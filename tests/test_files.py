@@ -1,9 +1,11 @@
 from collections.abc import Callable
 from datetime import datetime, timedelta
-from json import dumps, loads
+from hashlib import new as new_hash
+from hashlib import sha256
+from json import dumps
 from os import environ, stat_result
-from pathlib import Path
-from random import choice
+from pathlib import Path, PurePath, PurePosixPath
+from random import choice, randbytes
 from sys import version_info
 from unittest.mock import MagicMock
 
@@ -38,6 +40,8 @@ from alexlib.files.utils import (
     dump_envs,
     eval_parents,
     figsave,
+    filehash,
+    get_filename,
     get_parent,
     path_search,
     read_json,
@@ -119,6 +123,7 @@ def test_dir_obj_utility_methods(dir_obj: Directory):
     assert isinstance(dir_obj.tree, dict)
     assert isinstance(dir_obj.maxtreedepth, int)
 
+
 def test_dir_obj_make_subdir(dir_obj: Directory):
     """Test making a subdirectory."""
     subdir_name = "subdir"
@@ -127,6 +132,7 @@ def test_dir_obj_make_subdir(dir_obj: Directory):
     assert subdir_path.is_dir()
     assert dir_subdir == subdir_path
 
+
 @mark.parametrize(
     "path, include, exclude, expected",
     [
@@ -226,6 +232,23 @@ def test_eval_parents(path: Path, include: set, exclude: set, expected: bool):
     assert eval_parents(path, include, exclude) is expected
 
 
+@mark.parametrize(
+    "path, expected",
+    (
+        ("settings.json", "settings.json"),
+        ("config/.env", ".env"),
+        ("config/.env/", ".env"),
+        ("data/a.json//", "a.json"),
+        ("foo.json/.", "foo.json"),
+        ("cfg/.env/.", ".env"),
+        (Path("config/.env.local"), ".env.local"),
+        (PurePosixPath("data/a.json"), "a.json"),
+    ),
+)
+def test_get_filename(path: PurePath | str, expected: str):
+    assert get_filename(path) == expected
+
+
 def test_search_with_pattern(dir_path: Path):
     """Test searching with a specific pattern."""
     testfile_name = "test_file.txt"
@@ -447,11 +470,10 @@ def test_file_obj_str(text_file_obj: File):
     assert isinstance(str(text_file_obj), str)
 
 
+@mark.slow
+@mark.clipboard
 def test_file_clipboard(text_file_obj: File):
-    try:
-        assert isinstance(text_file_obj.clip(), str)
-    except OSError:
-        skip("Clipboard not available")
+    assert isinstance(text_file_obj.clip(), str)
 
 
 @mark.parametrize("label, scale", NBYTES_LABEL_MAP.items())
@@ -762,6 +784,25 @@ def test_sha256sum(this_file_hash: str):
     assert this_file_hash.isalnum()
 
 
+def test_sha256sum_matches_hashlib(tmp_path: Path):
+    path = tmp_path / "multi_chunk.bin"
+    path.write_bytes(randbytes(300 * 1024))
+    assert sha256sum(path) == sha256(path.read_bytes()).hexdigest()
+
+
+@mark.parametrize("algorithm", ("sha256", "sha512", "blake2b", "blake2s", "md5"))
+def test_filehash_matches_hashlib(tmp_path: Path, algorithm: str):
+    path = tmp_path / "multi_chunk.bin"
+    path.write_bytes(data := randbytes(300 * 1024))
+    assert filehash(path, algorithm=algorithm) == new_hash(algorithm, data).hexdigest()
+
+
+@mark.parametrize("algorithm", ("shake_128", "shake_256"))
+def test_filehash_variable_length_raises(this_file_path: Path, algorithm: str):
+    with raises(ValueError):
+        filehash(this_file_path, algorithm=algorithm)
+
+
 def test_sha256sum_not_found():
     with raises(FileNotFoundError):
         sha256sum(Path("notfound.txt"))
@@ -776,55 +817,31 @@ def test_chkhash(this_file_path: Path, this_file_hash: str):
     assert chkhash(this_file_path, this_file_hash)
 
 
-def test_dump_envs_dotenv(tmp_path, monkeypatch):
-    """Test dumping environment variables to a .env file."""
-    # Create a temporary .env file path
-    env_file = tmp_path / ".env"
-
-    # Mock logger
-    mock_logger = MagicMock()
-    monkeypatch.setattr("alexlib.files.utils.logger", mock_logger)
-
-    # Call the function
-    dump_envs(path=env_file)
-
-    # Assert that the file was created
-    assert env_file.exists()
-
-    # Read the content and verify
-    content = env_file.read_text()
-    expected_content = "\n".join(f"{key}={value}" for key, value in environ.items())
-    assert content == expected_content
-
-    # Verify logger info was called
-    mock_logger.info.assert_called_once_with(
-        f"Dumped {len(environ)} environment variables to {env_file}"
-    )
+DUMP_ENVS_FORMATS = (
+    (".env", lambda pairs: "\n".join(f"{key}={value}" for key, value in pairs.items())),
+    ("env.json", lambda pairs: dumps(pairs, indent=4)),
+)
 
 
-def test_dump_envs_json(tmp_path, monkeypatch):
-    """Test dumping environment variables to a .json file."""
-    # Create a temporary .json file path
-    json_file = tmp_path / "env.json"
+@mark.parametrize("filename, serialize", DUMP_ENVS_FORMATS, ids=(".env", ".json"))
+def test_dump_envs(
+    tmp_path: Path,
+    monkeypatch,
+    filename: str,
+    serialize: Callable[[dict[str, str]], str],
+):
+    """Test dumping environment variables to a .env or .json file."""
+    path = tmp_path / filename
 
     # Mock logger
     mock_logger = MagicMock()
     monkeypatch.setattr("alexlib.files.utils.logger", mock_logger)
 
-    # Call the function
-    dump_envs(path=json_file, force=True)
-
-    # Assert that the file was created
-    assert json_file.exists()
-
-    # Read the content and verify
-    content = json_file.read_text()
-    expected_content = dumps(dict(environ), indent=4)
-    assert loads(content) == loads(expected_content)
+    dump_envs(path=path)
 
-    # Verify logger info was called
+    assert path.read_text() == serialize(dict(environ))
     mock_logger.info.assert_called_once_with(
-        f"Dumped {len(environ)} environment variables to {json_file}"
+        f"Dumped {len(environ)} environment variables to {path}"
     )
 
 